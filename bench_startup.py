@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+Startup benchmark for worker processes.
+
+Loads the WSGI application in fresh interpreters and reports how long the
+import takes and the resident memory of the process afterwards, with and
+without the heavy preview dependencies (pandas) loaded. With --gunicorn it
+also boots gunicorn using gunicorn.conf.py and reports the RSS of each worker.
+
+    python bench_startup.py
+    python bench_startup.py --runs 10 --gunicorn
+"""
+
+import argparse
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Executed in a fresh interpreter so every run starts from a cold import.
+CHILD_SCRIPT = r"""
+import json, os, sys, time
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'research_data_repository.settings')
+start = time.perf_counter()
+from research_data_repository.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns  # load views, as the first request would
+if {with_pandas!r}:
+    import pandas
+elapsed = time.perf_counter() - start
+rss_kb = 0
+with open('/proc/self/status') as f:
+    for line in f:
+        if line.startswith('VmRSS:'):
+            rss_kb = int(line.split()[1])
+print(json.dumps({{'seconds': elapsed, 'rss_kb': rss_kb, 'pandas': 'pandas' in sys.modules}}))
+"""
+
+
+def read_rss_kb(pid):
+    """Return the resident set size of a process in KiB (Linux only)."""
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def child_pids(pid):
+    """Return the direct children of a process (Linux only)."""
+    pids = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == pid:
+            pids.append(int(entry))
+    return pids
+
+
+def measure_import(runs, with_pandas):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', CHILD_SCRIPT.format(with_pandas=with_pandas)],
+            cwd=BASE_DIR,
+        )
+        samples.append(json.loads(output))
+    return samples
+
+
+def report_import(label, samples):
+    seconds = [s['seconds'] * 1000 for s in samples]
+    rss = [s['rss_kb'] / 1024 for s in samples]
+    print(f"{label}:")
+    print(f"  import time  median {statistics.median(seconds):8.1f} ms   "
+          f"min {min(seconds):8.1f} ms")
+    print(f"  process RSS  median {statistics.median(rss):8.1f} MiB")
+    print(f"  pandas loaded: {samples[0]['pandas']}")
+
+
+def measure_gunicorn(workers, settle):
+    env = dict(os.environ, GUNICORN_WORKERS=str(workers), GUNICORN_BIND='127.0.0.1:0',
+               GUNICORN_ACCESS_LOG='/dev/null')
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'research_data_repository.wsgi'],
+        cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + settle
+        pids = []
+        while time.monotonic() < deadline:
+            pids = child_pids(proc.pid)
+            if len(pids) >= workers:
+                break
+            time.sleep(0.1)
+        # Give freshly forked workers a moment to finish post_fork.
+        time.sleep(0.5)
+        master = read_rss_kb(proc.pid)
+        worker_rss = {pid: read_rss_kb(pid) for pid in child_pids(proc.pid)}
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+    print(f"gunicorn ({len(worker_rss)} workers):")
+    print(f"  master RSS   {master / 1024:8.1f} MiB")
+    for pid, rss in sorted(worker_rss.items()):
+        print(f"  worker {pid:<6} {rss / 1024:8.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5,
+                        help='number of cold imports per scenario (default: 5)')
+    parser.add_argument('--gunicorn', action='store_true',
+                        help='also boot gunicorn and report per-worker RSS')
+    parser.add_argument('--workers', type=int, default=2,
+                        help='gunicorn workers to start with --gunicorn (default: 2)')
+    parser.add_argument('--settle', type=float, default=15.0,
+                        help='seconds to wait for gunicorn workers (default: 15)')
+    args = parser.parse_args()
+
+    report_import('WSGI app (lazy imports)', measure_import(args.runs, with_pandas=False))
+    report_import('WSGI app + pandas', measure_import(args.runs, with_pandas=True))
+    if args.gunicorn:
+        measure_gunicorn(args.workers, args.settle)
+
+
+if __name__ == '__main__':
+    main()
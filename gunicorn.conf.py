@@ -0,0 +1,74 @@
+"""
+Production gunicorn configuration for research_data_repository.
+
+gunicorn picks this file up automatically when started from the project root:
+
+    gunicorn research_data_repository.wsgi
+
+Every setting can be overridden with the matching GUNICORN_* environment
+variable, so the same file works on small and large instances.
+"""
+
+import gc
+import multiprocessing
+import os
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+
+# Worker model: a few processes with a handful of threads each. Requests are
+# mostly I/O bound (database lookups, file downloads), so threads give
+# concurrency without multiplying per-process memory.
+worker_class = 'gthread'
+workers = _env_int('GUNICORN_WORKERS', min(multiprocessing.cpu_count() * 2 + 1, 8))
+threads = _env_int('GUNICORN_THREADS', 4)
+timeout = _env_int('GUNICORN_TIMEOUT', 120)  # large uploads/previews
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+
+# Load Django once in the master and fork workers from it, so the code and
+# settings are shared copy-on-write instead of imported once per worker.
+preload_app = True
+
+# Follow the pattern recommended for gc.freeze(): keep the collector off in the
+# master while the app loads, freeze before forking, re-enable in each worker.
+gc.disable()
+
+# Recycle workers periodically so memory grown by pandas previews is given
+# back to the OS. The jitter keeps workers from restarting all at once.
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+# Keep worker heartbeat files off disk-backed /tmp where available.
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = os.environ.get('GUNICORN_ERROR_LOG', '-')
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def pre_fork(server, worker):
+    # Resolve the URLconf (and with it the views) in the master instead of on
+    # each worker's first request. get_resolver() is cached, so this only does
+    # work before the first fork.
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+
+    # Database connections must not be shared across processes; drop any the
+    # master opened while loading the app.
+    from django.db import connections
+    connections.close_all()
+
+    # Move everything allocated so far into the permanent generation. The
+    # cyclic GC then stops touching those objects in the workers, which would
+    # otherwise dirty the shared pages and defeat copy-on-write.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
@@ -0,0 +1,96 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+from django.conf import settings
+
+# Number of hex characters in the random part of a DOI
+DOI_SUFFIX_LENGTH = 8
+
+# How many times minting is retried when a DOI turns out to be taken
+DOI_MINT_ATTEMPTS = 5
+
+
+def generate_doi():
+    """Return a new mock DOI of the form 10.{YYYYMMDD}/{RANDOM}"""
+    date_str = datetime.now().strftime("%Y%m%d")
+    random_suffix = uuid.uuid4().hex[:DOI_SUFFIX_LENGTH].upper()
+    return f"10.{date_str}/{random_suffix}"
+
+
+def mint_dois(model, count):
+    """
+    Reserve `count` DOIs that are unique among themselves and not yet stored
+    for `model`. Candidates are checked against the database in one query per
+    round, so large batches cost a handful of queries rather than one each.
+    """
+    dois = set()
+    for _ in range(DOI_MINT_ATTEMPTS):
+        candidates = set()
+        while len(candidates) < count - len(dois):
+            doi = generate_doi()
+            if doi not in dois:
+                candidates.add(doi)
+        taken = set(
+            model._base_manager.filter(doi__in=candidates).values_list('doi', flat=True)
+        )
+        dois |= candidates - taken
+        if len(dois) == count:
+            return list(dois)
+    raise RuntimeError(f"Could not mint {count} unique DOIs after {DOI_MINT_ATTEMPTS} attempts.")
+
+
+class LRUCache:
+    """
+    Small thread-safe LRU cache with an optional time-to-live.
+
+    Entries are dropped explicitly through `invalidate` when the process that
+    owns the cache saves or deletes a dataset. The TTL bounds how long other
+    worker processes can keep serving an entry after such a change.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, expires = self._data[key]
+            except KeyError:
+                return default
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+# Resolved DOI metadata, keyed by DOI
+doi_cache = LRUCache(
+    maxsize=getattr(settings, 'DOI_CACHE_SIZE', 1024),
+    ttl=getattr(settings, 'DOI_CACHE_TTL', 300),
+)
@@ -1,7 +1,28 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 import uuid
-from datetime import datetime
 import os
+from .doi import DOI_MINT_ATTEMPTS, mint_dois, doi_cache
+
+
+class DatasetManager(models.Manager):
+    def bulk_create(self, objs, *args, **kwargs):
+        """Bulk insert datasets, reserving DOIs for all of them up front"""
+        objs = list(objs)
+        pending = [obj for obj in objs if not obj.doi]
+        for attempt in range(DOI_MINT_ATTEMPTS):
+            for obj, doi in zip(pending, mint_dois(self.model, len(pending))):
+                obj.doi = doi
+            try:
+                with transaction.atomic(using=self.db):
+                    return super().bulk_create(objs, *args, **kwargs)
+            except IntegrityError:
+                # Another writer may have claimed one of the reserved DOIs
+                # between reservation and insert; mint a fresh batch.
+                if not pending or attempt == DOI_MINT_ATTEMPTS - 1:
+                    raise
+
 
 class Dataset(models.Model):
     # Generate a unique ID for the dataset
@@ -24,20 +45,32 @@ class Dataset(models.Model):
     upload_date = models.DateTimeField(auto_now_add=True)
     last_modified = models.DateTimeField(auto_now=True)
     
+    objects = DatasetManager()
+    
     def save(self, *args, **kwargs):
-        # Generate mock DOI if not already set
-        if not self.doi:
-            # Format: 10.{year}{month}{day}/{random_string}
-            date_str = datetime.now().strftime("%Y%m%d")
-            random_suffix = uuid.uuid4().hex[:8].upper()
-            self.doi = f"10.{date_str}/{random_suffix}"
-        
         # Set file type if not already set
         if not self.file_type and self.file:
             _, ext = os.path.splitext(self.file.name)
             self.file_type = ext.lower().replace('.', '')
         
-        super().save(*args, **kwargs)
+        if self.doi:
+            super().save(*args, **kwargs)
+            return
+        
+        # Generate mock DOI, format: 10.{year}{month}{day}/{random_string}.
+        # A concurrent insert can still claim the same DOI between minting and
+        # saving, so retry with a fresh one instead of surfacing IntegrityError.
+        for attempt in range(DOI_MINT_ATTEMPTS):
+            self.doi = mint_dois(Dataset, 1)[0]
+            try:
+                with transaction.atomic(using=kwargs.get('using')):
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                collided = Dataset._base_manager.filter(doi=self.doi).exclude(pk=self.pk).exists()
+                if not collided or attempt == DOI_MINT_ATTEMPTS - 1:
+                    self.doi = ''
+                    raise
     
     def __str__(self):
         return f"{self.title} ({self.doi})"
@@ -45,4 +78,11 @@ class Dataset(models.Model):
     class Meta:
         ordering = ['-upload_date']
         verbose_name = "Dataset"
-        verbose_name_plural = "Datasets"
\ No newline at end of file
+        verbose_name_plural = "Datasets"
+
+
+@receiver(post_save, sender=Dataset)
+@receiver(post_delete, sender=Dataset)
+def invalidate_doi_cache(sender, instance, **kwargs):
+    """Drop the resolver's cached metadata for a changed dataset"""
+    doi_cache.invalidate(instance.doi)
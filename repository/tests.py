@@ -2,7 +2,9 @@ from django.test import TestCase, Client
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from django.contrib.auth.models import User
+from unittest import mock
 from .models import Dataset
+from .doi import doi_cache, mint_dois
 import os
 
 class DatasetModelTest(TestCase):
@@ -119,4 +121,118 @@ class DOIModelTest(TestCase):
             file_type="csv"
         )
         
-        self.assertNotEqual(dataset.doi, dataset2.doi)
\ No newline at end of file
+        self.assertNotEqual(dataset.doi, dataset2.doi)
+
+class LazyImportTest(TestCase):
+    def test_views_do_not_import_pandas(self):
+        """Test that loading the views does not pull in pandas"""
+        import subprocess
+        import sys
+        from django.conf import settings
+
+        script = (
+            "import django, sys; django.setup(); "
+            "import repository.views; "
+            "print('pandas' in sys.modules)"
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='research_data_repository.settings')
+        output = subprocess.check_output(
+            [sys.executable, '-c', script], cwd=settings.BASE_DIR, env=env
+        )
+        self.assertEqual(output.decode().strip(), 'False')
+
+
+class DOIResolverTest(TestCase):
+    def setUp(self):
+        doi_cache.clear()
+        self.client = Client()
+        self.dataset = Dataset.objects.create(
+            title="Resolver Dataset",
+            author="Resolver Author",
+            description="Resolver Description",
+            file=SimpleUploadedFile("test.csv", b"col1,col2\nval1,val2", content_type="text/csv"),
+            file_size=20,
+            file_type="csv"
+        )
+        self.prefix, self.suffix = self.dataset.doi.split("/")
+    
+    def test_resolve_doi_redirects_to_preview(self):
+        """Test that resolving a DOI redirects to the dataset preview"""
+        response = self.client.get(reverse('resolve_doi', args=[self.prefix, self.suffix]))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], reverse('dataset_preview', args=[self.dataset.id]))
+    
+    def test_resolve_doi_json(self):
+        """Test that resolving a DOI can return JSON metadata"""
+        response = self.client.get(
+            reverse('resolve_doi', args=[self.prefix, self.suffix.lower()]), {'format': 'json'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['doi'], self.dataset.doi)
+        self.assertEqual(response.json()['title'], "Resolver Dataset")
+    
+    def test_resolve_unknown_doi(self):
+        """Test that an unknown DOI returns 404"""
+        response = self.client.get(reverse('resolve_doi', args=["10.19000101", "FFFFFFFF"]))
+        self.assertEqual(response.status_code, 404)
+    
+    def test_resolve_doi_uses_cache(self):
+        """Test that a resolved DOI is served from the cache"""
+        url = reverse('resolve_doi', args=[self.prefix, self.suffix])
+        self.client.get(url, {'format': 'json'})
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {'format': 'json'})
+        self.assertEqual(response.status_code, 200)
+    
+    def test_cache_invalidated_on_save_and_delete(self):
+        """Test that saving or deleting a dataset drops its cached metadata"""
+        url = reverse('resolve_doi', args=[self.prefix, self.suffix])
+        self.client.get(url, {'format': 'json'})
+        
+        self.dataset.title = "Renamed Dataset"
+        self.dataset.save()
+        self.assertEqual(self.client.get(url, {'format': 'json'}).json()['title'], "Renamed Dataset")
+        
+        self.dataset.delete()
+        self.assertEqual(self.client.get(url, {'format': 'json'}).status_code, 404)
+    
+    def test_search_by_doi(self):
+        """Test that search matches an exact DOI"""
+        response = self.client.get(reverse('search_datasets'), {'query': self.dataset.doi.lower()})
+        self.assertContains(response, self.dataset.title)
+
+
+class DOIMintingTest(TestCase):
+    def _dataset(self, **kwargs):
+        return Dataset(
+            title="Mint Test",
+            author="Mint Author",
+            description="Mint Description",
+            file="datasets/mint.csv",
+            file_size=20,
+            file_type="csv",
+            **kwargs
+        )
+    
+    def test_mint_dois_batch_is_unique(self):
+        """Test that a reserved batch of DOIs has no duplicates"""
+        dois = mint_dois(Dataset, 200)
+        self.assertEqual(len(set(dois)), 200)
+    
+    def test_save_retries_on_doi_collision(self):
+        """Test that a colliding DOI is replaced instead of raising IntegrityError"""
+        existing = self._dataset()
+        existing.save()
+        
+        with mock.patch('repository.models.mint_dois', side_effect=[[existing.doi], ['10.20250101/ABCDEF12']]):
+            dataset = self._dataset()
+            dataset.save()
+        
+        self.assertEqual(dataset.doi, '10.20250101/ABCDEF12')
+    
+    def test_bulk_create_assigns_dois(self):
+        """Test that bulk_create reserves a DOI for every dataset"""
+        datasets = Dataset.objects.bulk_create([self._dataset() for _ in range(50)])
+        dois = [dataset.doi for dataset in datasets]
+        self.assertTrue(all(dois))
+        self.assertEqual(Dataset.objects.filter(doi__in=dois).count(), 50)
@@ -8,6 +8,7 @@ urlpatterns = [
     path('preview/<uuid:dataset_id>/', views.dataset_preview, name='dataset_preview'),
     path('search/', views.search_datasets, name='search_datasets'),
     path('download/<uuid:dataset_id>/', views.download_dataset, name='download_dataset'),
+    path('doi/<str:prefix>/<str:suffix>/', views.resolve_doi, name='resolve_doi'),
     path('register/', auth_views.register, name='register'),
     path('login/', auth_views.user_login, name='login'),
     path('logout/', auth_views.user_logout, name='logout'),
@@ -1,11 +1,12 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, Http404
 from django.contrib import messages
 from django.core.paginator import Paginator
 from django.contrib.auth.decorators import login_required
+from django.urls import reverse
 from .models import Dataset
+from .doi import doi_cache
 import os
-import pandas as pd
 import mimetypes
 from django.http import FileResponse
 from django.utils.encoding import smart_str
@@ -85,7 +86,11 @@ def dataset_preview(request, dataset_id):
             }
             return render(request, 'repository/preview.html', context)
         
-        # Load data using pandas for CSV/XLSX files
+        # Load data using pandas for CSV/XLSX files. pandas is imported here
+        # rather than at module level so workers that never render a preview
+        # don't pay its import time and memory.
+        import pandas as pd
+
         if dataset.file_type == 'csv':
             df = pd.read_csv(file_path)
         elif dataset.file_type == 'xlsx':
@@ -121,6 +126,8 @@ def search_datasets(request):
             title__icontains=query
         ) | datasets_list.filter(
             author__icontains=query
+        ) | datasets_list.filter(
+            doi=query.strip().upper()
         )
     
     # Pagination
@@ -159,4 +166,45 @@ def download_dataset(request, dataset_id):
         return redirect('home')
     except Exception as e:
         messages.error(request, f'Error downloading dataset: {str(e)}')
-        return redirect('home')
\ No newline at end of file
+        return redirect('home')
+
+def resolve_doi(request, prefix, suffix):
+    """Resolve a DOI to its dataset, as a redirect or as JSON metadata"""
+    doi = f"{prefix}/{suffix}".upper()
+    metadata = doi_cache.get(doi)
+    
+    if metadata is None:
+        # Single lookup on the unique (indexed) doi column
+        try:
+            dataset = Dataset.objects.only(
+                'id', 'title', 'author', 'description', 'file_size', 'file_type', 'doi', 'upload_date'
+            ).get(doi=doi)
+        except Dataset.DoesNotExist:
+            if _wants_json(request):
+                return JsonResponse({'error': f'DOI {doi} not found.'}, status=404)
+            raise Http404(f'DOI {doi} not found.')
+        
+        metadata = {
+            'id': str(dataset.id),
+            'doi': dataset.doi,
+            'title': dataset.title,
+            'author': dataset.author,
+            'description': dataset.description,
+            'file_type': dataset.file_type,
+            'file_size': dataset.file_size,
+            'upload_date': dataset.upload_date.isoformat(),
+            'preview_url': reverse('dataset_preview', args=[dataset.id]),
+            'download_url': reverse('download_dataset', args=[dataset.id]),
+        }
+        doi_cache.set(doi, metadata)
+    
+    if _wants_json(request):
+        return JsonResponse(metadata)
+    return redirect(metadata['preview_url'])
+
+def _wants_json(request):
+    """Return True if the client asked for JSON rather than a redirect"""
+    return (
+        request.GET.get('format') == 'json'
+        or 'application/json' in request.headers.get('Accept', '')
+    )